@@ -160,6 +160,13 @@ def remove_from_ignored_identifiers(identifier: str):
     else:
         logger.warning(f"'{identifier}' not found in the ignored tools list.")
 
+def set_ignored_identifiers(identifiers: List[str]):
+    """Replaces the whole ignored list (duplicates dropped, order kept) with a single load and save."""
+    config = load_config()
+    config["ignored_tools_identifiers"] = list(dict.fromkeys(identifiers))
+    save_config(config)
+    logger.info(f"Set ignored tools list to {config['ignored_tools_identifiers']}.")
+
 # Example of how to use it (optional, for direct testing of this module)
 if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG) # Set to DEBUG for detailed output from this module
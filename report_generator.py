@@ -2,139 +2,301 @@
 Takes raw data from scans and structures it for GUI display and export.
 Handles formatting for TXT, MD, JSON, and HTML reports.
 """
+import dataclasses
+import functools
+import html
 import json
 import logging
-import html
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any # Add typing imports
 
 # Attempt to import data classes for type hinting
 # These might still show as unresolved in Pylance if the root workspace/PYTHONPATH issue persists
-from scan_logic import DetectedComponent, EnvironmentVariableInfo, ScanIssue
+from scan_logic import (DetectedComponent, EnvironmentVariableInfo, ScanIssue,
+                        component_sort_key, env_var_sort_key, issue_sort_key)
+
+try:
+    import orjson # Optional: much faster JSON export, falls back to the json module
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Section rules for the TXT report
+_SEP_EQ = "=" * 40 + "\n\n"
+_SEP_DASH = "-" * 30 + "\n"
+
+# Large scans produce reports of hundreds of KB; a 1 MiB buffer keeps json.dump from flushing every 8 KB
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Module alias so the HTML formatters skip the html.escape attribute lookup per call.
+_esc = html.escape
+
+# Component details keys ("Architecture", "user.name", ...) repeat across components; values rarely do.
+@functools.lru_cache(maxsize=1024)
+def _esc_cached(s: str) -> str:
+    return html.escape(s)
+
+# Static parts of the HTML report, shared by every export.
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang='en'>
+<head>
+  <meta charset='UTF-8'>
+  <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+  <title>Developer Environment Audit Report</title>
+
+  <style>
+    body { font-family: sans-serif; margin: 20px; line-height: 1.6; }
+    .container { max-width: 1000px; margin: auto; background: #f9f9f9; padding: 20px; border-radius: 8px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }
+    h1, h2, h3 { color: #333; }
+    h1 { text-align: center; }
+    h2 { border-bottom: 2px solid #eee; padding-bottom: 10px; margin-top: 30px; }
+    h3 { margin-top: 20px; color: #555; }
+    ul { list-style-type: none; padding-left: 0; }
+    li { margin-bottom: 10px; }
+    code { background-color: #eef; padding: 2px 5px; border-radius: 4px; font-family: monospace; }
+    .issue { border-left: 5px solid; padding-left: 10px; margin-bottom: 10px; }
+    .issue.Critical { border-color: red; background-color: #ffebee; }
+    .issue.Warning { border-color: orange; background-color: #fff3e0; }
+    .issue.Info { border-color: dodgerblue; background-color: #e3f2fd; }
+    .collapsible { background-color: #777; color: white; cursor: pointer; padding: 10px; width: 100%; border: none; text-align: left; outline: none; font-size: 1.1em; margin-top:10px; border-radius: 5px; }
+    .collapsible:hover { background-color: #555; }
+    .collapsible.active:after { content: "\\2212"; } /* Minus sign */
+    .collapsible:not(.active):after { content: '\\002B'; } /* Plus sign */
+    .collapsible:after { font-weight: bold; float: right; margin-left: 5px; }
+    .content { padding: 0 18px; max-height: 0; overflow: hidden; transition: max-height 0.2s ease-out; background-color: #f1f1f1; border-radius: 0 0 5px 5px; }
+    .timestamp { text-align: center; color: #777; margin-bottom: 20px; }
+  </style>
+</head>
+<body>
+<div class='container'>
+<h1>Developer Environment Audit Report</h1>
+"""
+
+# Report body between _HTML_HEAD and _HTML_FOOTER; filled in once per export with str.format.
+_HTML_BODY = """<p class='timestamp'>Generated: {report_time}</p>
+<button type='button' class='collapsible active'>Detected Tools & Versions</button>
+<div class='content' style='max-height: initial;'>
+{components}</div>
+<button type='button' class='collapsible'>Active Environment Variables</button>
+<div class='content'>
+<ul>
+{env_vars}</ul>
+</div>
+<button type='button' class='collapsible'>Identified Issues & Warnings</button>
+<div class='content'>
+<ul>
+{issues}</ul>
+</div>
+"""
+
+_HTML_FOOTER = """
+<script>
+  var coll = document.getElementsByClassName("collapsible");
+  for (var i = 0; i < coll.length; i++) {
+    coll[i].addEventListener("click", function() {
+      this.classList.toggle("active");
+      var content = this.nextElementSibling;
+      if (content.style.maxHeight){
+        content.style.maxHeight = null;
+      } else {
+        content.style.maxHeight = content.scrollHeight + "px";
+      }
+    });
+  }
+</script>
+</div>
+</body>
+</html>"""
+
 class ReportGenerator:
+    # Opening wrapper for each issue in the HTML report, keyed by severity
+    _SEVERITY_PREFIX_HTML = {s: f"<div class='issue {s}'>" for s in ("Critical", "Warning", "Info")}
+
     def __init__(self,
                  detected_components: List[DetectedComponent],
                  environment_variables: List[EnvironmentVariableInfo],
-                 issues: List[ScanIssue]):
-        self.detected_components = sorted(detected_components, key=lambda x: (x.category, x.name, x.version))
-        self.environment_variables = sorted(environment_variables, key=lambda x: x.name)
-        self.issues = sorted(issues, key=lambda x: (x.severity, x.category, x.description))
+                 issues: List[ScanIssue],
+                 pre_sorted: bool = False):
+        if pre_sorted: # Caller guarantees the same ordering as below (e.g. gui_manager.ScanData)
+            self.detected_components = detected_components
+            self.environment_variables = environment_variables
+            self.issues = issues
+        else:
+            self.detected_components = sorted(detected_components, key=component_sort_key)
+            self.environment_variables = sorted(environment_variables, key=env_var_sort_key)
+            self.issues = sorted(issues, key=issue_sort_key)
+        # Per-item issue lists may hold plain strings; wrap them once so the formatters can rely on ScanIssue fields.
+        self.detected_components = self._with_scan_issues(self.detected_components)
+        self.environment_variables = self._with_scan_issues(self.environment_variables)
         self.report_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    def _format_component(self, component, format_type="txt"):
-        """Formats a single component for different output types."""
-        lines = []
-        name_version = f"{component.name} ({component.version})"
-        if format_type == "md":
-            lines.append(f"### {name_version}")
-            lines.append(f"- **ID:** `{component.id}`")
-            lines.append(f"- **Category:** {component.category}")
-            lines.append(f"- **Path:** `{component.path}`")
-            if component.executable_path and component.executable_path != component.path:
-                lines.append(f"- **Executable:** `{component.executable_path}`")
-        elif format_type == "html":
-            lines.append(f"<h3>{html.escape(name_version)}</h3>")
-            lines.append("<ul>")
-            lines.append(f"<li><b>ID:</b> <code>{html.escape(component.id)}</code></li>")
-            lines.append(f"<li><b>Category:</b> {html.escape(component.category)}</li>")
-            lines.append(f"<li><b>Path:</b> <code>{html.escape(component.path)}</code></li>")
-            if component.executable_path and component.executable_path != component.path:
-                lines.append(f"<li><b>Executable:</b> <code>{html.escape(component.executable_path)}</code></li>")
-        else: # txt
-            lines.append(f"Tool: {name_version}")
-            lines.append(f"  ID: {component.id}")
-            lines.append(f"  Category: {component.category}")
-            lines.append(f"  Path: {component.path}")
-            if component.executable_path and component.executable_path != component.path:
-                lines.append(f"  Executable: {component.executable_path}")
+    @classmethod
+    def from_scan_data(cls, scan_data) -> "ReportGenerator":
+        """Creates a generator from a gui_manager.ScanData, whose lists are already sorted, without sorting them again."""
+        return cls(scan_data.detected_components, scan_data.environment_variables, scan_data.issues, pre_sorted=True)
+
+    @staticmethod
+    def _with_scan_issues(items):
+        """Returns items as-is, or a new list where items with plain-string issues are copies holding ScanIssue objects instead."""
+        if all(isinstance(issue, ScanIssue) for item in items for issue in item.issues):
+            return items
+        return [item if all(isinstance(issue, ScanIssue) for issue in item.issues) else
+                dataclasses.replace(item, issues=[issue if isinstance(issue, ScanIssue) else ScanIssue(description=str(issue), severity="")
+                                                  for issue in item.issues])
+                for item in items]
+
+    def _format_component_txt(self, component):
+        """Formats a single component as plain text."""
+        parts = [
+            f"Tool: {component.name} ({component.version})\n"
+            f"  ID: {component.id}\n"
+            f"  Category: {component.category}\n"
+            f"  Path: {component.path}"
+        ]
+        if component.executable_path and component.executable_path != component.path:
+            parts.append(f"\n  Executable: {component.executable_path}")
 
         if component.details:
-            if format_type == "html": lines.append("<li><b>Details:</b><ul>")
-            else: lines.append(f"  Details:")
-            for key, value in component.details.items():
-                if format_type == "md": lines.append(f"  - **{key}:** {value}")
-                elif format_type == "html": lines.append(f"<li><em>{html.escape(key)}:</em> {html.escape(str(value))}</li>")
-                else: lines.append(f"    {key}: {value}")
-            if format_type == "html": lines.append("</ul></li>")
-
-        if component.update_info:
-            ui = component.update_info
-            status = "Update Available" if ui.get('is_update_available') else "Up-to-date"
-            if ui.get('latest_version'):
-                update_line = f"{status}: Installed {component.version} -> Latest {ui['latest_version']} (via {ui['package_manager_name']})"
-                cmd_line = f"Update Command: `{ui['update_command']}`" if ui.get('update_command') else ""
-
-                if format_type == "md":
-                    lines.append(f"- **Update Status:** {update_line}")
-                    if cmd_line: lines.append(f"  - {cmd_line}")
-                elif format_type == "html":
-                    lines.append(f"<li><b>Update Status:</b> {html.escape(update_line)}")
-                    if cmd_line: lines.append(f"<br/>&nbsp;&nbsp;<em>{html.escape(cmd_line)}</em>")
-                    lines.append("</li>")
-                else:
-                    lines.append(f"  Update Status: {update_line}")
-                    if cmd_line: lines.append(f"    {cmd_line}")
+            parts.append("\n  Details:")
+            parts.extend(f"\n    {key}: {value}" for key, value in component.details.items())
+
+        update_line, cmd_line = self._update_status_lines(component)
+        if update_line:
+            parts.append(f"\n  Update Status: {update_line}")
+            if cmd_line: parts.append(f"\n    {cmd_line}")
 
         if component.issues:
-            if format_type == "html": lines.append("<li><b>Issues:</b><ul>")
-            else: lines.append(f"  Issues:")
-            for issue in component.issues: # issue is already a string or ScanIssue object
-                desc = issue.description if hasattr(issue, 'description') else str(issue)
-                sev = f" ({issue.severity})" if hasattr(issue, 'severity') else ""
-                if format_type == "md": lines.append(f"  - *{desc}{sev}*")
-                elif format_type == "html": lines.append(f"<li><em>{html.escape(desc)}{html.escape(sev)}</em></li>")
-                else: lines.append(f"    - {desc}{sev}")
-            if format_type == "html": lines.append("</ul></li>")
-
-        if format_type == "html": lines.append("</ul>")
-        return "\n".join(lines)
+            parts.append("\n  Issues:")
+            for issue in component.issues:
+                sev = f" ({issue.severity})" if issue.severity else ""
+                parts.append(f"\n    - {issue.description}{sev}")
+        return "".join(parts)
+
+    def _format_component_md(self, component):
+        """Formats a single component as Markdown."""
+        parts = [
+            f"### {component.name} ({component.version})\n"
+            f"- **ID:** `{component.id}`\n"
+            f"- **Category:** {component.category}\n"
+            f"- **Path:** `{component.path}`"
+        ]
+        if component.executable_path and component.executable_path != component.path:
+            parts.append(f"\n- **Executable:** `{component.executable_path}`")
 
-    def _format_env_var(self, env_var, format_type="txt"):
-        lines = []
-        val_display = env_var.value
-        if len(val_display) > 200 and format_type != "json": # Truncate long values for readability
-            val_display = val_display[:200] + "..."
+        if component.details:
+            parts.append("\n  Details:")
+            parts.extend(f"\n  - **{key}:** {value}" for key, value in component.details.items())
 
-        if format_type == "md":
-            lines.append(f"- **`{env_var.name}`** (`{env_var.scope}`): `{val_display}`")
-        elif format_type == "html":
-            lines.append(f"<li><code>{html.escape(env_var.name)}</code> (<i>{html.escape(env_var.scope)}</i>): <code>{html.escape(val_display)}</code>")
-        else: # txt
-            lines.append(f"{env_var.name} ({env_var.scope}): {val_display}")
+        update_line, cmd_line = self._update_status_lines(component)
+        if update_line:
+            parts.append(f"\n- **Update Status:** {update_line}")
+            if cmd_line: parts.append(f"\n  - {cmd_line}")
 
+        if component.issues:
+            parts.append("\n  Issues:")
+            for issue in component.issues:
+                sev = f" ({issue.severity})" if issue.severity else ""
+                parts.append(f"\n  - *{issue.description}{sev}*")
+        return "".join(parts)
+
+    def _format_component_html(self, component):
+        """Formats a single component as an HTML fragment."""
+        parts = [
+            f"<h3>{_esc(f'{component.name} ({component.version})')}</h3>\n"
+            f"<ul>\n"
+            f"<li><b>ID:</b> <code>{_esc(component.id)}</code></li>\n"
+            f"<li><b>Category:</b> {_esc(component.category)}</li>\n"
+            f"<li><b>Path:</b> <code>{_esc(component.path)}</code></li>"
+        ]
+        if component.executable_path and component.executable_path != component.path:
+            parts.append(f"\n<li><b>Executable:</b> <code>{_esc(component.executable_path)}</code></li>")
+
+        if component.details:
+            parts.append("\n<li><b>Details:</b><ul>")
+            parts.extend(f"\n<li><em>{_esc_cached(key)}:</em> {_esc(str(value))}</li>" for key, value in component.details.items())
+            parts.append("\n</ul></li>")
+
+        update_line, cmd_line = self._update_status_lines(component)
+        if update_line:
+            parts.append(f"\n<li><b>Update Status:</b> {_esc(update_line)}")
+            if cmd_line: parts.append(f"\n<br/>&nbsp;&nbsp;<em>{_esc(cmd_line)}</em>")
+            parts.append("\n</li>")
+
+        if component.issues:
+            parts.append("\n<li><b>Issues:</b><ul>")
+            for issue in component.issues:
+                sev = f" ({issue.severity})" if issue.severity else ""
+                parts.append(f"\n<li><em>{_esc(issue.description)}{_esc(sev)}</em></li>")
+            parts.append("\n</ul></li>")
+
+        parts.append("\n</ul>")
+        return "".join(parts)
+
+    @staticmethod
+    def _update_status_lines(component):
+        """Returns the (update status, update command) lines for a component, or ("", "") if there is nothing to report."""
+        ui = component.update_info
+        if not ui or not ui.get('latest_version'):
+            return "", ""
+        status = "Update Available" if ui.get('is_update_available') else "Up-to-date"
+        update_line = f"{status}: Installed {component.version} -> Latest {ui['latest_version']} (via {ui['package_manager_name']})"
+        cmd_line = f"Update Command: `{ui['update_command']}`" if ui.get('update_command') else ""
+        return update_line, cmd_line
+
+    @staticmethod
+    def _env_value_display(value):
+        """Truncates long values for readability; JSON export uses to_dict() and keeps the full value."""
+        return value if len(value) <= 200 else value[:200] + "..."
+
+    def _format_env_var_txt(self, env_var):
+        val_display = self._env_value_display(env_var.value)
+        lines = [f"{env_var.name} ({env_var.scope}): {val_display}"]
+        for issue in env_var.issues:
+            sev = f" ({issue.severity})" if issue.severity else ""
+            lines.append(f"  - Issue:{sev} {issue.description}")
+        return "\n".join(lines)
+
+    def _format_env_var_md(self, env_var):
+        val_display = self._env_value_display(env_var.value)
+        lines = [f"- **`{env_var.name}`** (`{env_var.scope}`): `{val_display}`"]
+        for issue in env_var.issues:
+            sev = f" ({issue.severity})" if issue.severity else ""
+            lines.append(f"  - *Issue:{sev} {issue.description}*")
+        return "\n".join(lines)
+
+    def _format_env_var_html(self, env_var):
+        val_display = self._env_value_display(env_var.value)
+        lines = [f"<li><code>{_esc(env_var.name)}</code> (<i>{_esc(env_var.scope)}</i>): <code>{_esc(val_display)}</code>"]
         if env_var.issues:
-            if format_type == "html": lines.append("<ul>")
+            lines.append("<ul>")
             for issue in env_var.issues:
-                desc = issue.description if hasattr(issue, 'description') else str(issue)
-                sev = f" ({issue.severity})" if hasattr(issue, 'severity') else ""
-                if format_type == "md": lines.append(f"  - *Issue:{sev} {desc}*")
-                elif format_type == "html": lines.append(f"<li><em>Issue:{html.escape(sev)} {html.escape(desc)}</em></li>")
-                else: lines.append(f"  - Issue:{sev} {desc}")
-            if format_type == "html": lines.append("</ul>")
-        if format_type == "html": lines.append("</li>")
+                sev = f" ({issue.severity})" if issue.severity else ""
+                lines.append(f"<li><em>Issue:{_esc(sev)} {_esc(issue.description)}</em></li>")
+            lines.append("</ul>")
+        lines.append("</li>")
         return "\n".join(lines)
 
-    def _format_issue(self, issue, format_type="txt"):
-        line = ""
-        comp_info = f" (Component: {issue.component_id})" if issue.component_id else ""
-        path_info = f" (Path: {issue.related_path})" if issue.related_path else ""
+    def _format_issue_txt(self, issue):
+        return (f"- {issue.severity} ({issue.category}): {issue.description}"
+                f"{f' (Component: {issue.component_id})' if issue.component_id else ''}"
+                f"{f' (Path: {issue.related_path})' if issue.related_path else ''}")
 
-        if format_type == "md":
-            line = f"- **{issue.severity} ({issue.category}):** {issue.description}{comp_info}{path_info}"
-        elif format_type == "html":
-            line = f"<li><b>{html.escape(issue.severity)} ({html.escape(issue.category)}):</b> {html.escape(issue.description)}{html.escape(comp_info)}{html.escape(path_info)}</li>"
-        else: # txt
-            line = f"- {issue.severity} ({issue.category}): {issue.description}{comp_info}{path_info}"
-        return line
+    def _format_issue_md(self, issue):
+        return (f"- **{issue.severity} ({issue.category}):** {issue.description}"
+                f"{f' (Component: {issue.component_id})' if issue.component_id else ''}"
+                f"{f' (Path: {issue.related_path})' if issue.related_path else ''}")
 
-    def generate_report_data_for_gui(self):
-        """Prepares data in a structured way suitable for the GUI."""
-        # This can return the raw lists, and the GUI can format them.
-        # Or, it can return pre-formatted strings if the GUI needs that.
-        # For now, let's assume GUI will handle its own formatting from these objects.
+    def _format_issue_html(self, issue):
+        return (f"<li><b>{_esc(issue.severity)} ({_esc(issue.category)}):</b> {_esc(issue.description)}"
+                f"{f' (Component: {_esc(issue.component_id)})' if issue.component_id else ''}"
+                f"{f' (Path: {_esc(issue.related_path)})' if issue.related_path else ''}</li>")
+
+    @functools.cached_property
+    def _report_dict(self):
+        # Built once per generator; the component/variable/issue lists are not mutated after __init__.
         return {
             "report_time": self.report_time,
             "detected_components": [comp.to_dict() for comp in self.detected_components],
@@ -142,38 +304,49 @@ class ReportGenerator:
             "issues": [iss.to_dict() for iss in self.issues]
         }
 
+    def generate_report_data_for_gui(self):
+        """Prepares data in a structured way suitable for the GUI."""
+        # This can return the raw lists, and the GUI can format them.
+        # Or, it can return pre-formatted strings if the GUI needs that.
+        # For now, let's assume GUI will handle its own formatting from these objects.
+        return self._report_dict
+
     def export_to_txt(self, filepath):
         logger.info(f"Exporting report to TXT: {filepath}")
+        format_component = self._format_component_txt
+        format_env_var = self._format_env_var_txt
+        format_issue = self._format_issue_txt
+        parts = []
+        append = parts.append
+        append(f"Developer Environment Audit Report\n")
+        append(f"Generated: {self.report_time}\n")
+        append(_SEP_EQ)
+
+        append("Detected Tools & Versions\n")
+        append(_SEP_DASH)
+        if self.detected_components:
+            append("\n\n".join(format_component(comp) for comp in self.detected_components) + "\n\n")
+        else:
+            append("No components detected.\n\n")
+
+        append("Active Environment Variables\n")
+        append(_SEP_DASH)
+        if self.environment_variables:
+            append("\n".join(format_env_var(ev) for ev in self.environment_variables) + "\n")
+        else:
+            append("No environment variables collected or to display.\n")
+        append("\n")
+
+        append("Identified Issues & Warnings\n")
+        append(_SEP_DASH)
+        if self.issues:
+            append("\n".join(format_issue(issue) for issue in self.issues) + "\n")
+        else:
+            append("No issues identified.\n")
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"Developer Environment Audit Report\n")
-                f.write(f"Generated: {self.report_time}\n")
-                f.write("=" * 40 + "\n\n")
-
-                f.write("Detected Tools & Versions\n")
-                f.write("-" * 30 + "\n")
-                if self.detected_components:
-                    for comp in self.detected_components:
-                        f.write(self._format_component(comp, "txt") + "\n\n")
-                else:
-                    f.write("No components detected.\n\n")
-
-                f.write("Active Environment Variables\n")
-                f.write("-" * 30 + "\n")
-                if self.environment_variables:
-                    for ev in self.environment_variables:
-                        f.write(self._format_env_var(ev, "txt") + "\n")
-                else:
-                    f.write("No environment variables collected or to display.\n")
-                f.write("\n")
-
-                f.write("Identified Issues & Warnings\n")
-                f.write("-" * 30 + "\n")
-                if self.issues:
-                    for issue in self.issues:
-                        f.write(self._format_issue(issue, "txt") + "\n")
-                else:
-                    f.write("No issues identified.\n")
+            with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write("".join(parts))
             logger.info(f"TXT report saved to {filepath}")
             return True
         except IOError as e:
@@ -182,34 +355,38 @@ class ReportGenerator:
 
     def export_to_markdown(self, filepath):
         logger.info(f"Exporting report to Markdown: {filepath}")
+        format_component = self._format_component_md
+        format_env_var = self._format_env_var_md
+        format_issue = self._format_issue_md
+        parts = []
+        append = parts.append
+        append(f"# Developer Environment Audit Report\n\n")
+        append(f"**Generated:** {self.report_time}\n\n")
+        append("---\n\n")
+
+        append("## Detected Tools & Versions\n\n")
+        if self.detected_components:
+            append("\n\n".join(format_component(comp) for comp in self.detected_components) + "\n\n")
+        else:
+            append("No components detected.\n\n")
+        append("---\n\n")
+
+        append("## Active Environment Variables\n\n")
+        if self.environment_variables:
+            append("\n".join(format_env_var(ev) for ev in self.environment_variables) + "\n")
+        else:
+            append("No environment variables collected or to display.\n")
+        append("\n---\n\n")
+
+        append("## Identified Issues & Warnings\n\n")
+        if self.issues:
+            append("\n".join(format_issue(issue) for issue in self.issues) + "\n")
+        else:
+            append("No issues identified.\n\n")
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"# Developer Environment Audit Report\n\n")
-                f.write(f"**Generated:** {self.report_time}\n\n")
-                f.write("---\n\n")
-
-                f.write("## Detected Tools & Versions\n\n")
-                if self.detected_components:
-                    for comp in self.detected_components:
-                        f.write(self._format_component(comp, "md") + "\n\n")
-                else:
-                    f.write("No components detected.\n\n")
-                f.write("---\n\n")
-
-                f.write("## Active Environment Variables\n\n")
-                if self.environment_variables:
-                    for ev in self.environment_variables:
-                        f.write(self._format_env_var(ev, "md") + "\n")
-                else:
-                    f.write("No environment variables collected or to display.\n")
-                f.write("\n---\n\n")
-
-                f.write("## Identified Issues & Warnings\n\n")
-                if self.issues:
-                    for issue in self.issues:
-                        f.write(self._format_issue(issue, "md") + "\n")
-                else:
-                    f.write("No issues identified.\n\n")
+            with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write("".join(parts))
             logger.info(f"Markdown report saved to {filepath}")
             return True
         except IOError as e:
@@ -218,10 +395,14 @@ class ReportGenerator:
 
     def export_to_json(self, filepath):
         logger.info(f"Exporting report to JSON: {filepath}")
-        report_data = self.generate_report_data_for_gui() # Use the same structure
+        report_data = self._report_dict # Same structure as generate_report_data_for_gui()
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2)
+            if orjson is not None:
+                with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                    json.dump(report_data, f, indent=2)
             logger.info(f"JSON report saved to {filepath}")
             return True
         except (IOError, TypeError) as e: # TypeError for objects not serializable
@@ -230,113 +411,58 @@ class ReportGenerator:
 
     def export_to_html(self, filepath):
         logger.info(f"Exporting report to HTML: {filepath}")
-        # Define HTML template as a raw string literal
-        html_template = f"""<!DOCTYPE html>
-<html lang='en'>
-<head>
-  <meta charset='UTF-8'>
-  <meta name='viewport' content='width=device-width, initial-scale=1.0'>
-  <title>Developer Environment Audit Report</title>
-  <style>
-    body {{ font-family: sans-serif; margin: 20px; line-height: 1.6; }}
-    .container {{ max-width: 1000px; margin: auto; background: #f9f9f9; padding: 20px; border-radius: 8px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
-    h1, h2, h3 {{ color: #333; }}
-    h1 {{ text-align: center; }}
-    h2 {{ border-bottom: 2px solid #eee; padding-bottom: 10px; margin-top: 30px; }}
-    h3 {{ margin-top: 20px; color: #555; }}
-    ul {{ list-style-type: none; padding-left: 0; }}
-    li {{ margin-bottom: 10px; }}
-    code {{ background-color: #eef; padding: 2px 5px; border-radius: 4px; font-family: monospace; }}
-    .issue {{ border-left: 5px solid; padding-left: 10px; margin-bottom: 10px; }}
-    .issue.Critical {{ border-color: red; background-color: #ffebee; }}
-    .issue.Warning {{ border-color: orange; background-color: #fff3e0; }}
-    .issue.Info {{ border-color: dodgerblue; background-color: #e3f2fd; }}
-    .collapsible {{ background-color: #777; color: white; cursor: pointer; padding: 10px; width: 100%; border: none; text-align: left; outline: none; font-size: 1.1em; margin-top:10px; border-radius: 5px; }}
-    .collapsible:hover {{ background-color: #555; }}
-    .collapsible.active:after {{ content: "\2212"; }} /* Minus sign */
-    .collapsible:not(.active):after {{ content: '\002B'; }} /* Plus sign */
-    .collapsible:after {{ font-weight: bold; float: right; margin-left: 5px; }}
-    .content {{ padding: 0 18px; max-height: 0; overflow: hidden; transition: max-height 0.2s ease-out; background-color: #f1f1f1; border-radius: 0 0 5px 5px; }}
-    .timestamp {{ text-align: center; color: #777; margin-bottom: 20px; }}
-  </style>
-</head>
-<body>
-<div class='container'>
-<h1>Developer Environment Audit Report</h1>
-<p class='timestamp'>Generated: {html.escape(self.report_time)}</p>
-
-<button type='button' class='collapsible active'>Detected Tools & Versions</button>
-<div class='content' style='max-height: initial;'>
-{{components_section}}
-</div>
-
-<button type='button' class='collapsible'>Active Environment Variables</button>
-<div class='content'>
-<ul>
-{{env_vars_section}}
-</ul>
-</div>
-
-<button type='button' class='collapsible'>Identified Issues & Warnings</button>
-<div class='content'>
-<ul>
-{{issues_section}}
-</ul>
-</div>
-
-<script>
-  var coll = document.getElementsByClassName("collapsible");
-  for (var i = 0; i < coll.length; i++) {{
-    coll[i].addEventListener("click", function() {{
-      this.classList.toggle("active");
-      var content = this.nextElementSibling;
-      if (content.style.maxHeight){{
-        content.style.maxHeight = null;
-      }} else {{
-        content.style.maxHeight = content.scrollHeight + "px";
-      }}
-    }});
-  }}
-</script>
-</div>
-</body>
-</html>"""
-
-        components_html = ""
+        format_component = self._format_component_html
+        format_env_var = self._format_env_var_html
+        format_issue = self._format_issue_html
         if self.detected_components:
-            for comp in self.detected_components:
-                components_html += self._format_component(comp, "html") + "<hr/>\n"
+            components = "<hr/>\n".join(format_component(comp) for comp in self.detected_components) + "<hr/>\n"
         else:
-            components_html = "<p>No components detected.</p>\n"
+            components = "<p>No components detected.</p>\n"
 
-        env_vars_html = ""
         if self.environment_variables:
-            for ev in self.environment_variables:
-                env_vars_html += self._format_env_var(ev, "html") + "\n"
+            env_vars = "\n".join(format_env_var(ev) for ev in self.environment_variables) + "\n"
         else:
-            env_vars_html = "<li>No environment variables collected or to display.</li>\n"
+            env_vars = "<li>No environment variables collected or to display.</li>\n"
 
-        issues_html = ""
         if self.issues:
-            for issue in self.issues:
-                issues_html += f"<div class='issue {html.escape(issue.severity)}'>"
-                issues_html += self._format_issue(issue, "html") + "</div>\n"
+            severity_prefix = self._SEVERITY_PREFIX_HTML
+            issues = "".join(
+                (severity_prefix.get(issue.severity) or f"<div class='issue {_esc(issue.severity)}'>")
+                + format_issue(issue) + "</div>\n"
+                for issue in self.issues
+            )
         else:
-            issues_html = "<li>No issues identified.</li>\n"
+            issues = "<li>No issues identified.</li>\n"
 
-        final_html = html_template.replace("{{components_section}}", components_html)
-        final_html = final_html.replace("{{env_vars_section}}", env_vars_html)
-        final_html = final_html.replace("{{issues_section}}", issues_html)
+        body = _HTML_BODY.format(report_time=_esc(self.report_time), components=components,
+                                 env_vars=env_vars, issues=issues)
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(final_html)
+            with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(_HTML_HEAD + body + _HTML_FOOTER)
             logger.info(f"HTML report saved to {filepath}")
             return True
         except IOError as e:
             logger.error(f"Failed to write HTML report to {filepath}: {e}")
             return False
 
+    def export_all(self, dirpath, basename="devenvaudit_report"):
+        """Exports TXT, Markdown, JSON and HTML reports into dirpath concurrently.
+
+        Returns a dict mapping each file extension to its exporter's success flag.
+        """
+        exporters = {
+            "txt": self.export_to_txt,
+            "md": self.export_to_markdown,
+            "json": self.export_to_json,
+            "html": self.export_to_html,
+        }
+        # Exporters only read the lists sorted in __init__, so they can run side by side.
+        with ThreadPoolExecutor(max_workers=len(exporters)) as pool:
+            futures = {ext: pool.submit(export, os.path.join(dirpath, f"{basename}.{ext}"))
+                       for ext, export in exporters.items()}
+            return {ext: future.result() for ext, future in futures.items()}
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
@@ -364,7 +490,6 @@ if __name__ == '__main__':
 
     # Test exports
     output_dir = "test_reports"
-    import os
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
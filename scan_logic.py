@@ -107,6 +107,17 @@ class EnvironmentVariableInfo:
         }
 
 
+# Report ordering shared by EnvironmentScanner, gui_manager.ScanData and report_generator.ReportGenerator
+def component_sort_key(comp: DetectedComponent) -> Tuple:
+    return (comp.category, comp.name, comp.version)
+
+def env_var_sort_key(env_var: EnvironmentVariableInfo) -> str:
+    return env_var.name
+
+def issue_sort_key(issue: ScanIssue) -> Tuple:
+    return (issue.severity, issue.category, issue.description)
+
+
 class SoftwareCategorizer:
     def __init__(self, db_path: str = SOFTWARE_CATEGORIZATION_DB_PATH):
         self.db_path = db_path
@@ -316,7 +327,7 @@ class EnvironmentScanner:
 
     def _find_executables_for_tool(self, tool_config: Dict[str, Any]) -> List[str]:
         exe_paths_found = set()
-        current_system = platform.system()
+        current_system = self.system # Looked up once in __init__
         os_specific_executables = tool_config.get("executables", {}).get(current_system, [])
         if not os_specific_executables and current_system != "Windows": # Fallback for Unix-like
             os_specific_executables = tool_config.get("executables", {}).get("Linux", [])
@@ -505,7 +516,7 @@ class EnvironmentScanner:
             self.environment_variables.append(env_var_info)
             if var_issues:
                 self.issues.extend(var_issues)
-        self.environment_variables.sort(key=lambda x: x.name)
+        self.environment_variables.sort(key=env_var_sort_key)
         logger.info(f"Collected {len(self.environment_variables)} environment variables.")
 
     def _get_os_specific_scan_roots(self) -> List[str]:
@@ -759,6 +770,10 @@ class EnvironmentScanner:
         self.collect_environment_variables()
         self.cross_reference_and_analyze()
 
+        # Return results in report order so ScanData can skip re-sorting (pre_sorted=True)
+        self.detected_components.sort(key=component_sort_key)
+        self.issues.sort(key=issue_sort_key)
+
         self._update_status("Scan complete.")
         logger.info("Full scan process finished.")
         return self.detected_components, self.environment_variables, self.issues
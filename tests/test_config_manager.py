@@ -1,6 +1,8 @@
 import unittest
 import os
+import copy
 import json
+import pickle
 import tempfile
 import shutil
 from unittest.mock import patch, MagicMock
@@ -8,33 +10,35 @@ from unittest.mock import patch, MagicMock
 # Ensure the config_manager module can be imported.
 import config_manager # Assuming it's in PYTHONPATH or tests are run from project root
 
+# DEFAULT_CONFIG as imported, plus a pickled snapshot each test restores a fresh copy from
+_ORIGINAL_DEFAULT_CONFIG = config_manager.DEFAULT_CONFIG
+_PRISTINE_BLOB = pickle.dumps(_ORIGINAL_DEFAULT_CONFIG, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Keep the per-test config files in tmpfs where available
+_TMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
 class TestConfigManager(unittest.TestCase):
 
     def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
+        self.test_dir = tempfile.mkdtemp(dir=_TMP_ROOT)
 
         # Mock directory and file paths used by config_manager
         self.mock_config_dir_path = os.path.join(self.test_dir, "TestDevEnvAuditConfig")
         self.mock_config_file_path = os.path.join(self.mock_config_dir_path, config_manager.CONFIG_FILE_NAME)
 
-        self.patch_config_dir = patch('config_manager.CONFIG_DIR_PATH', self.mock_config_dir_path)
-        self.patch_config_file = patch('config_manager.CONFIG_FILE_PATH', self.mock_config_file_path)
-
-        self.mock_config_dir = self.patch_config_dir.start()
-        self.mock_file = self.patch_config_file.start()
+        config_paths = patch.multiple(config_manager, CONFIG_DIR_PATH=self.mock_config_dir_path,
+                                      CONFIG_FILE_PATH=self.mock_config_file_path)
+        config_paths.start()
+        self.addCleanup(config_paths.stop)
 
-        # Make a pristine copy of DEFAULT_CONFIG for each test
-        self.original_default_config = config_manager.DEFAULT_CONFIG.copy()
-        # Ensure nested dictionaries are also copied deeply if they exist and are mutable
-        config_manager.DEFAULT_CONFIG = json.loads(json.dumps(self.original_default_config)) # Deep copy via JSON
+        # Give each test its own pristine (deep) copy of DEFAULT_CONFIG
+        config_manager.DEFAULT_CONFIG = pickle.loads(_PRISTINE_BLOB)
 
 
     def tearDown(self):
-        self.patch_config_dir.stop()
-        self.patch_config_file.stop()
         shutil.rmtree(self.test_dir)
         # Restore original DEFAULT_CONFIG
-        config_manager.DEFAULT_CONFIG = self.original_default_config
+        config_manager.DEFAULT_CONFIG = _ORIGINAL_DEFAULT_CONFIG
 
     def test_ensure_config_dir_exists_creates_dir(self):
         if os.path.exists(self.mock_config_dir_path):
@@ -57,7 +61,12 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(on_disk_cfg, config_manager.DEFAULT_CONFIG)
 
     def test_save_and_load_config(self):
-        test_settings = json.loads(json.dumps(config_manager.DEFAULT_CONFIG)) # Deep copy
+        # Copy only the branches mutated below
+        default_config = config_manager.DEFAULT_CONFIG
+        test_settings = dict(default_config)
+        test_settings["scan_options"] = dict(default_config["scan_options"])
+        test_settings["scan_options"]["excluded_paths"] = list(default_config["scan_options"]["excluded_paths"])
+        test_settings["user_preferences"] = dict(default_config["user_preferences"])
         test_settings["scan_options"]["scan_paths"] = ["/test/path"]
         test_settings["scan_options"]["excluded_paths"].append("*.tmp")
         test_settings["ignored_tools_identifiers"] = ["tool_a", "tool_b"]
@@ -87,7 +96,7 @@ class TestConfigManager(unittest.TestCase):
         scan_options = config_manager.get_scan_options()
         self.assertEqual(scan_options, config_manager.DEFAULT_CONFIG["scan_options"])
 
-        modified_cfg = json.loads(json.dumps(cfg)) # Deep copy
+        modified_cfg = copy.deepcopy(cfg)
         modified_cfg["scan_options"]["perform_update_checks"] = False
         config_manager.save_config(modified_cfg)
 
@@ -102,19 +111,26 @@ class TestConfigManager(unittest.TestCase):
         self.assertIn("tool_id_1", config_manager.get_ignored_identifiers())
 
         config_manager.add_to_ignored_identifiers("tool_id_1")
-        self.assertEqual(config_manager.get_ignored_identifiers().count("tool_id_1"), 1)
-        self.assertEqual(len(config_manager.get_ignored_identifiers()), 1)
+        self.assertEqual(config_manager.get_ignored_identifiers(), ["tool_id_1"]) # Not added twice
 
         config_manager.add_to_ignored_identifiers("tool_id_2")
-        self.assertIn("tool_id_2", config_manager.get_ignored_identifiers())
-        self.assertEqual(len(config_manager.get_ignored_identifiers()), 2)
+        self.assertEqual(config_manager.get_ignored_identifiers(), ["tool_id_1", "tool_id_2"])
 
         config_manager.remove_from_ignored_identifiers("tool_id_1")
-        self.assertNotIn("tool_id_1", config_manager.get_ignored_identifiers())
-        self.assertEqual(len(config_manager.get_ignored_identifiers()), 1)
+        self.assertEqual(config_manager.get_ignored_identifiers(), ["tool_id_2"])
 
         config_manager.remove_from_ignored_identifiers("tool_id_non_existent")
-        self.assertEqual(len(config_manager.get_ignored_identifiers()), 1)
+        self.assertEqual(config_manager.get_ignored_identifiers(), ["tool_id_2"])
+
+    def test_set_ignored_identifiers(self):
+        config_manager.load_config()
+        with patch('config_manager.save_config', wraps=config_manager.save_config) as mock_save:
+            config_manager.set_ignored_identifiers(["tool_id_1", "tool_id_2", "tool_id_1"])
+        mock_save.assert_called_once()
+        self.assertEqual(config_manager.get_ignored_identifiers(), ["tool_id_1", "tool_id_2"])
+
+        config_manager.set_ignored_identifiers(["tool_id_2"])
+        self.assertEqual(config_manager.get_ignored_identifiers(), ["tool_id_2"])
 
     def test_load_config_does_not_deep_merge_by_default(self):
         os.makedirs(self.mock_config_dir_path, exist_ok=True)
@@ -125,7 +141,7 @@ class TestConfigManager(unittest.TestCase):
             "ignored_tools_identifiers": ["partial_tool"]
         }
         with open(self.mock_config_file_path, 'w') as f:
-            json.dump(partial_config, f, indent=4)
+            json.dump(partial_config, f)
 
         loaded_config = config_manager.load_config()
 
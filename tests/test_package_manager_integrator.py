@@ -4,50 +4,33 @@ import platform
 
 import package_manager_integrator as pmi
 
+_SYS = platform.system()
+
 class TestPackageManagerIntegrator(unittest.TestCase):
 
-    def setUp(self):
-        # Mock the detected package managers to control which ones are "found"
-        self.patch_shutil_which = patch('shutil.which')
-        self.mock_shutil_which = self.patch_shutil_which.start()
-
-        self.patch_run_pm_command = patch('package_manager_integrator._run_pm_command')
-        self.mock_run_pm_command = self.patch_run_pm_command.start()
-
-    def tearDown(self):
-        self.patch_shutil_which.stop()
-        self.patch_run_pm_command.stop()
-
-    def test_detect_package_managers_windows(self):
-        if platform.system() == "Windows":
-            self.mock_shutil_which.side_effect = lambda exe: f"C:\\path\\to\\{exe}.exe" if exe in ["winget", "choco"] else None
-            detected = pmi.detect_package_managers()
-            self.assertIn("winget", detected)
-            self.assertIn("choco", detected)
-            self.assertNotIn("scoop", detected)
-            self.assertNotIn("brew", detected)
-            self.assertEqual(detected["winget"]["path"], "C:\\path\\to\\winget.exe")
-        else:
-            self.skipTest("Skipping Windows specific PM detection test on non-Windows OS.")
-
-    def test_detect_package_managers_macos(self):
-        if platform.system() == "Darwin":
-            self.mock_shutil_which.side_effect = lambda exe: f"/usr/local/bin/{exe}" if exe == "brew" else None
-            detected = pmi.detect_package_managers()
-            self.assertIn("brew", detected)
-            self.assertNotIn("apt", detected)
-        else:
-            self.skipTest("Skipping macOS specific PM detection test on non-macOS OS.")
-
-    def test_detect_package_managers_linux(self):
-        if platform.system() == "Linux":
-            self.mock_shutil_which.side_effect = lambda exe: f"/usr/bin/{exe}" if exe in ["apt-get", "snap"] else None
-            detected = pmi.detect_package_managers()
-            self.assertIn("apt", detected) # Note: 'apt' detection uses 'apt-get'
-            self.assertIn("snap", detected)
-            self.assertNotIn("brew", detected) # Unless Linuxbrew is specifically mocked
-        else:
-            self.skipTest("Skipping Linux specific PM detection test on non-Linux OS.")
+    # platform.system() value -> (executables shutil.which finds, PMs expected, PMs not expected)
+    PM_DETECTION_CASES = {
+        "Windows": ({"winget": "C:\\path\\to\\winget.exe", "choco": "C:\\path\\to\\choco.exe"},
+                    ["winget", "choco"], ["scoop", "brew"]),
+        "Darwin": ({"brew": "/usr/local/bin/brew"}, ["brew"], ["apt"]),
+        "Linux": ({"apt-get": "/usr/bin/apt-get", "snap": "/usr/bin/snap"}, # Note: 'apt' detection uses 'apt-get'
+                  ["apt", "snap"], ["brew"]), # brew absent unless Linuxbrew is specifically mocked
+    }
+
+    @patch('shutil.which')
+    def test_detect_package_managers(self, mock_shutil_which):
+        for system, (found_exes, expected, not_expected) in self.PM_DETECTION_CASES.items():
+            with self.subTest(system=system):
+                if system != _SYS:
+                    self.skipTest(f"{system} only")
+                mock_shutil_which.side_effect = found_exes.get
+                detected = pmi.detect_package_managers()
+                for pm in expected:
+                    self.assertIn(pm, detected)
+                    if pm in found_exes:
+                        self.assertEqual(detected[pm]["path"], found_exes[pm])
+                for pm in not_expected:
+                    self.assertNotIn(pm, detected)
 
     def test_get_pm_package_name(self):
         self.assertEqual(pmi.get_pm_package_name("python", "apt"), "python3")
@@ -103,10 +86,11 @@ Git          Git.Git             2.40.0   Moniker
         self.assertEqual(pmi.parse_version_from_output(output, "winget", "Git.Git"), "2.40.0")
         self.assertIsNone(pmi.parse_version_from_output(output, "winget", "NonExistent.Package"))
 
+    @patch('package_manager_integrator._run_pm_command')
     @patch('package_manager_integrator.detect_package_managers')
-    def test_get_latest_version_and_update_command_success(self, mock_detect_pms):
+    def test_get_latest_version_and_update_command_success(self, mock_detect_pms, mock_run_pm_command):
         mock_detect_pms.return_value = {"brew": {"name": "Homebrew", "path": "/usr/local/bin/brew"}}
-        self.mock_run_pm_command.return_value = ("git: stable 2.40.0 (bottled), HEAD\n", "")
+        mock_run_pm_command.return_value = ("git: stable 2.40.0 (bottled), HEAD\n", "")
 
         tool_id = "git"
         tool_name = "Git"
@@ -133,28 +117,31 @@ Git          Git.Git             2.40.0   Moniker
         result = pmi.get_latest_version_and_update_command("unknown_tool_id", "UnknownTool", "1.0", ["apt"])
         self.assertIsNone(result)
 
+    @patch('package_manager_integrator._run_pm_command')
     @patch('package_manager_integrator.detect_package_managers')
-    def test_get_latest_version_pm_command_fails(self, mock_detect_pms):
+    def test_get_latest_version_pm_command_fails(self, mock_detect_pms, mock_run_pm_command):
         mock_detect_pms.return_value = {"brew": {"name": "Homebrew", "path":"/usr/local/bin/brew"}}
-        self.mock_run_pm_command.return_value = (None, "Error occurred")
+        mock_run_pm_command.return_value = (None, "Error occurred")
         result = pmi.get_latest_version_and_update_command("git", "Git", "1.0", ["brew"])
         self.assertIsNone(result)
 
+    @patch('package_manager_integrator._run_pm_command')
     @patch('package_manager_integrator.detect_package_managers')
-    def test_get_latest_version_version_parse_fails(self, mock_detect_pms):
+    def test_get_latest_version_version_parse_fails(self, mock_detect_pms, mock_run_pm_command):
         mock_detect_pms.return_value = {"brew": {"name": "Homebrew", "path":"/usr/local/bin/brew"}}
-        self.mock_run_pm_command.return_value = ("Some unexpected output", "")
+        mock_run_pm_command.return_value = ("Some unexpected output", "")
         result = pmi.get_latest_version_and_update_command("git", "Git", "1.0", ["brew"])
         self.assertIsNone(result)
 
+    # Test-only tools mapped for brew; patch.dict restores the shared map even if an assertion fails
+    @patch.dict(pmi.TOOL_TO_PM_PACKAGE_MAP, {"mytool_id_version_test": {"brew": "mytool-package"},
+                                             "mytool_lexical": {"brew": "mytool-lex"}})
+    @patch('package_manager_integrator._run_pm_command')
     @patch('package_manager_integrator.detect_package_managers')
-    def test_version_comparison_logic(self, mock_detect_pms):
+    def test_version_comparison_logic(self, mock_detect_pms, mock_run_pm_command):
         mock_detect_pms.return_value = {"brew": {"name": "Homebrew", "path": "/usr/local/bin/brew"}}
 
-        # Mock a tool that exists in TOOL_TO_PM_PACKAGE_MAP for brew
-        original_tool_map = pmi.TOOL_TO_PM_PACKAGE_MAP.get("mytool_id_version_test")
-        pmi.TOOL_TO_PM_PACKAGE_MAP["mytool_id_version_test"] = {"brew": "mytool-package"}
-        self.mock_run_pm_command.return_value = ("mytool-package: stable 1.0.10\n", "")
+        mock_run_pm_command.return_value = ("mytool-package: stable 1.0.10\n", "")
 
         # Case 1: packaging library works (default behavior, no need to patch parse_version itself here unless testing its absence)
         result = pmi.get_latest_version_and_update_command("mytool_id_version_test", "MyToolVersionTest", "1.0.2", ["brew"])
@@ -168,24 +155,15 @@ Git          Git.Git             2.40.0   Moniker
         # Case 2: packaging library import fails (fallback to string comparison)
         # For this, we need to simulate the ImportError for 'packaging.version' inside the function
         with patch.dict('sys.modules', {'packaging.version': None, 'packaging': None}): # Simulate packaging module not being available
-            pmi.TOOL_TO_PM_PACKAGE_MAP['mytool_lexical'] = {'brew': 'mytool-lex'}
-            self.mock_run_pm_command.return_value = ("mytool-lex: stable 1.2\n", "")
+            mock_run_pm_command.return_value = ("mytool-lex: stable 1.2\n", "")
             result_lex = pmi.get_latest_version_and_update_command("mytool_lexical", "MyToolLex", "1.11", ["brew"]) # "1.2" > "1.11" lexicographically
             self.assertIsNotNone(result_lex)
             self.assertTrue(result_lex["is_update_available"])
 
-            self.mock_run_pm_command.return_value = ("mytool-lex: stable 2.0\n", "")
+            mock_run_pm_command.return_value = ("mytool-lex: stable 2.0\n", "")
             result_lex_major = pmi.get_latest_version_and_update_command("mytool_lexical", "MyToolLex", "1.9.9", ["brew"])
             self.assertIsNotNone(result_lex_major)
             self.assertTrue(result_lex_major["is_update_available"]) # "2.0" > "1.9.9"
 
-            del pmi.TOOL_TO_PM_PACKAGE_MAP['mytool_lexical']
-
-        # Restore original map if it existed, otherwise remove the test key
-        if original_tool_map is not None:
-            pmi.TOOL_TO_PM_PACKAGE_MAP["mytool_id_version_test"] = original_tool_map
-        else:
-            del pmi.TOOL_TO_PM_PACKAGE_MAP["mytool_id_version_test"]
-
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
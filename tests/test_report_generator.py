@@ -4,16 +4,33 @@ import tempfile
 import shutil
 import json
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from report_generator import ReportGenerator
 from scan_logic import DetectedComponent, EnvironmentVariableInfo, ScanIssue
 
+try:
+    import orjson # Optional, as in report_generator
+except ImportError:
+    orjson = None
+
+def _read_json(filepath):
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 class TestReportGenerator(unittest.TestCase):
 
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        # Every test writes to its own file name, so one directory serves the whole class
+        cls.test_dir = tempfile.mkdtemp()
 
-        self.comp1 = DetectedComponent(
+        # Fixtures are only read by the tests, so build them once
+        cls.comp1 = DetectedComponent(
             id="python_3.9_fake",
             name="Python",
             category="Language",
@@ -25,7 +42,7 @@ class TestReportGenerator(unittest.TestCase):
             update_info={"latest_version": "3.9.10", "package_manager_name": "fakepm",
                          "update_command": "fakepm update python", "is_update_available": True}
         )
-        self.comp2 = DetectedComponent(
+        cls.comp2 = DetectedComponent(
             id="git_2.30_fake",
             name="Git",
             category="VCS",
@@ -34,27 +51,36 @@ class TestReportGenerator(unittest.TestCase):
             executable_path="/fake/bin/git",
             details={"user.name": "Test User"}
         )
-        self.env1 = EnvironmentVariableInfo(
+        cls.env1 = EnvironmentVariableInfo(
             name="PATH",
             value="/usr/bin:/bin",
             scope="active_session",
             issues=[ScanIssue(description="Duplicate entry /bin", severity="Info", related_path="/bin")]
         )
-        self.env2 = EnvironmentVariableInfo(name="API_KEY", value="****SENSITIVE_VALUE****", scope="active_session")
+        cls.env2 = EnvironmentVariableInfo(name="API_KEY", value="****SENSITIVE_VALUE****", scope="active_session")
 
-        self.issue1 = ScanIssue(description="Critical system problem", severity="Critical", category="System")
-        self.issue2 = ScanIssue(description="Config warning for Git", severity="Warning", component_id="git_2.30_fake", category="Configuration")
+        cls.issue1 = ScanIssue(description="Critical system problem", severity="Critical", category="System")
+        cls.issue2 = ScanIssue(description="Config warning for Git", severity="Warning", component_id="git_2.30_fake", category="Configuration")
 
-        self.detected_components = [self.comp1, self.comp2]
-        self.environment_variables = [self.env1, self.env2]
-        self.issues = [self.issue1, self.issue2]
+        cls.detected_components = [cls.comp1, cls.comp2]
+        cls.environment_variables = [cls.env1, cls.env2]
+        cls.issues = [cls.issue1, cls.issue2]
 
-        self.reporter = ReportGenerator(
-            self.detected_components, self.environment_variables, self.issues
+        cls.reporter = ReportGenerator(
+            cls.detected_components, cls.environment_variables, cls.issues
         )
 
-    def tearDown(self):
-        shutil.rmtree(self.test_dir)
+        # Export every format once, concurrently; the per-format tests only inspect the files
+        cls.export_results = cls.reporter.export_all(cls.test_dir, basename="report")
+        cls.export_paths = {ext: os.path.join(cls.test_dir, f"report.{ext}") for ext in cls.export_results}
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_dir)
+
+    def assertAllIn(self, needles, haystack):
+        missing = [needle for needle in needles if needle not in haystack]
+        self.assertFalse(missing, f"Missing from output: {missing}")
 
     def test_generate_report_data_for_gui(self):
         data = self.reporter.generate_report_data_for_gui()
@@ -69,42 +95,62 @@ class TestReportGenerator(unittest.TestCase):
         self.assertEqual(data["issues"][0]["severity"], "Critical")
         self.assertEqual(data["issues"][1]["severity"], "Warning")
 
+    def test_report_data_is_built_once(self):
+        reporter = ReportGenerator([self.comp2], [self.env2], [self.issue2])
+        data = reporter.generate_report_data_for_gui()
+        filepath = os.path.join(self.test_dir, "cached_data.json")
+        with patch.object(DetectedComponent, 'to_dict', side_effect=AssertionError("re-serialized")):
+            self.assertTrue(reporter.export_to_json(filepath))
+            self.assertIs(reporter.generate_report_data_for_gui(), data)
+        self.assertEqual(_read_json(filepath)["detected_components"][0]["name"], "Git")
+
+    def test_from_scan_data_reuses_sorted_lists(self):
+        scan_data = SimpleNamespace(
+            detected_components=self.reporter.detected_components,
+            environment_variables=self.reporter.environment_variables,
+            issues=self.reporter.issues
+        )
+        reporter = ReportGenerator.from_scan_data(scan_data)
+        self.assertIs(reporter.detected_components, scan_data.detected_components)
+        self.assertIs(reporter.environment_variables, scan_data.environment_variables)
+        self.assertIs(reporter.issues, scan_data.issues)
+
     def test_export_to_txt(self):
-        filepath = os.path.join(self.test_dir, "report.txt")
-        success = self.reporter.export_to_txt(filepath)
-        self.assertTrue(success)
+        filepath = self.export_paths["txt"]
+        self.assertTrue(self.export_results["txt"])
         self.assertTrue(os.path.exists(filepath))
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
-            self.assertIn("Developer Environment Audit Report", content)
-            self.assertIn("Tool: Python (3.9.7)", content)
-            self.assertIn("Update Status: Update Available: Installed 3.9.7 -> Latest 3.9.10 (via fakepm)", content)
-            self.assertIn("Update Command: `fakepm update python`", content)
-            self.assertIn("PATH (active_session): /usr/bin:/bin", content)
-            self.assertIn("- Critical (System): Critical system problem", content)
-            self.assertIn("API_KEY (active_session): ****SENSITIVE_VALUE****", content)
+            self.assertAllIn([
+                "Developer Environment Audit Report",
+                "Tool: Python (3.9.7)",
+                "Update Status: Update Available: Installed 3.9.7 -> Latest 3.9.10 (via fakepm)",
+                "Update Command: `fakepm update python`",
+                "PATH (active_session): /usr/bin:/bin",
+                "- Critical (System): Critical system problem",
+                "API_KEY (active_session): ****SENSITIVE_VALUE****",
+            ], content)
 
     def test_export_to_markdown(self):
-        filepath = os.path.join(self.test_dir, "report.md")
-        success = self.reporter.export_to_markdown(filepath)
-        self.assertTrue(success)
+        filepath = self.export_paths["md"]
+        self.assertTrue(self.export_results["md"])
         self.assertTrue(os.path.exists(filepath))
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
-            self.assertIn("# Developer Environment Audit Report", content)
-            self.assertIn("### Python (3.9.7)", content)
-            self.assertIn("- **Update Status:** Update Available: Installed 3.9.7 -> Latest 3.9.10 (via fakepm)", content)
-            self.assertIn("  - Update Command: `fakepm update python`", content)
-            self.assertIn("- **`PATH`** (`active_session`): `/usr/bin:/bin`", content)
-            self.assertIn("- **Critical (System):** Critical system problem", content)
+            self.assertAllIn([
+                "# Developer Environment Audit Report",
+                "### Python (3.9.7)",
+                "- **Update Status:** Update Available: Installed 3.9.7 -> Latest 3.9.10 (via fakepm)",
+                "  - Update Command: `fakepm update python`",
+                "- **`PATH`** (`active_session`): `/usr/bin:/bin`",
+                "- **Critical (System):** Critical system problem",
+            ], content)
 
     def test_export_to_json(self):
-        filepath = os.path.join(self.test_dir, "report.json")
-        success = self.reporter.export_to_json(filepath)
-        self.assertTrue(success)
+        filepath = self.export_paths["json"]
+        self.assertTrue(self.export_results["json"])
         self.assertTrue(os.path.exists(filepath))
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
         self.assertIn("report_time", data)
         self.assertEqual(len(data["detected_components"]), 2)
         self.assertEqual(data["detected_components"][0]["name"], "Python")
@@ -115,19 +161,57 @@ class TestReportGenerator(unittest.TestCase):
         self.assertEqual(data["issues"][0]["severity"], "Critical")
 
     def test_export_to_html(self):
-        filepath = os.path.join(self.test_dir, "report.html")
-        success = self.reporter.export_to_html(filepath)
-        self.assertTrue(success)
+        filepath = self.export_paths["html"]
+        self.assertTrue(self.export_results["html"])
         self.assertTrue(os.path.exists(filepath))
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
-            self.assertIn("<!DOCTYPE html>", content)
-            self.assertIn("<title>Developer Environment Audit Report</title>", content)
-            self.assertIn("<h3>Python (3.9.7)</h3>", content)
-            self.assertIn("Update Status: Update Available: Installed 3.9.7 -&gt; Latest 3.9.10 (via fakepm)", content)
-            self.assertIn("<code>PATH</code>", content)
-            self.assertIn("<div class='issue Critical'>", content)
-            self.assertIn("<b>Critical (System):</b> Critical system problem", content)
+            self.assertAllIn([
+                "<!DOCTYPE html>",
+                "<title>Developer Environment Audit Report</title>",
+                "<h3>Python (3.9.7)</h3>",
+                "<b>Update Status:</b> Update Available: Installed 3.9.7 -&gt; Latest 3.9.10 (via fakepm)",
+                "<code>PATH</code>",
+                "<div class='issue Critical'>",
+                "<b>Critical (System):</b> Critical system problem",
+            ], content)
+
+    def test_export_to_html_escapes_markup(self):
+        comp = DetectedComponent(
+            id="tool_<1>", name="Tool & \"Co\"", category="Util's", version="1.0",
+            path="/opt/<tool>", details={"<key>": "a & b"}
+        )
+        reporter = ReportGenerator([comp], [], [])
+        filepath = os.path.join(self.test_dir, "escaped.html")
+        self.assertTrue(reporter.export_to_html(filepath))
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+            self.assertAllIn([
+                "<h3>Tool &amp; &quot;Co&quot; (1.0)</h3>",
+                "<code>tool_&lt;1&gt;</code>",
+                "<li><b>Category:</b> Util&#x27;s</li>",
+                "<code>/opt/&lt;tool&gt;</code>",
+                "<li><em>&lt;key&gt;:</em> a &amp; b</li>",
+            ], content)
+
+    def test_plain_string_issues_are_reported(self):
+        comp = DetectedComponent(id="tool_fake", name="Tool", issues=["Plain string issue"])
+        env = EnvironmentVariableInfo(name="TOOL_HOME", value="/opt/tool", issues=["Env string issue"])
+        reporter = ReportGenerator([comp], [env], [])
+        filepath = os.path.join(self.test_dir, "string_issues.txt")
+        self.assertTrue(reporter.export_to_txt(filepath))
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+            self.assertIn("    - Plain string issue\n", content)
+            self.assertIn("  - Issue: Env string issue\n", content)
+        # The caller's objects are left as they were
+        self.assertEqual(comp.issues, ["Plain string issue"])
+        self.assertEqual(env.issues, ["Env string issue"])
+
+    def test_export_all(self):
+        self.assertEqual(self.export_results, {"txt": True, "md": True, "json": True, "html": True})
+        for filepath in self.export_paths.values():
+            self.assertTrue(os.path.exists(filepath))
 
     def test_empty_data_export(self):
         empty_reporter = ReportGenerator([], [], [])
@@ -135,17 +219,18 @@ class TestReportGenerator(unittest.TestCase):
         empty_reporter.export_to_txt(filepath_txt)
         with open(filepath_txt, 'r', encoding='utf-8') as f:
             content = f.read()
-            self.assertIn("No components detected.", content)
-            self.assertIn("No environment variables collected or to display.", content)
-            self.assertIn("No issues identified.", content)
+            self.assertAllIn([
+                "No components detected.",
+                "No environment variables collected or to display.",
+                "No issues identified.",
+            ], content)
 
         filepath_json = os.path.join(self.test_dir, "empty_report.json")
         empty_reporter.export_to_json(filepath_json)
-        with open(filepath_json, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            self.assertEqual(len(data["detected_components"]), 0)
-            self.assertEqual(len(data["environment_variables"]), 0)
-            self.assertEqual(len(data["issues"]), 0)
+        data = _read_json(filepath_json)
+        self.assertEqual(len(data["detected_components"]), 0)
+        self.assertEqual(len(data["environment_variables"]), 0)
+        self.assertEqual(len(data["issues"]), 0)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,191 +1,174 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock, DEFAULT
+import os
+import copy
 import platform
+import subprocess
+from pathlib import Path
+from types import MappingProxyType
 
-import package_manager_integrator as pmi
+import config_manager
+import scan_logic
 
-class TestPackageManagerIntegrator(unittest.TestCase):
+_SYS = platform.system()
+
+# The scanner only reads its config, so every test can share read-only views of one copy
+_CONFIG_TEMPLATE = copy.deepcopy(config_manager.DEFAULT_CONFIG)
+
+def _make_popen_mock(stdout="", stderr="", returncode=0, communicate_side_effect=None):
+    """Bare stand-in for a Popen instance; _run_command only uses communicate(), kill() and returncode."""
+    process = Mock()
+    process.communicate.return_value = (stdout, stderr)
+    process.communicate.side_effect = communicate_side_effect
+    process.returncode = returncode
+    return process
+
+# Paths that "exist" in test_collect_environment_variables; side_effect=_VALID_PATHS.__contains__ answers in C
+_VALID_PATHS = frozenset(("/fake/bin", "/duplicate/path", "/fake/home"))
+
+_PYTHON_VERSION_RE = r"Python\s+([0-9\.]+)"
+
+# Single-tool stand-in for scan_logic.TOOLS_DB, built once and read-only
+_TEST_TOOLS_DB = (
+    MappingProxyType({
+        "id": "python", "name": "Python", "category": "Language",
+        "executables": {_SYS: ["python3"]},
+        "version_args": ["--version"],
+        "version_regex": _PYTHON_VERSION_RE,
+    }),
+)
+
+class TestScanLogic(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Run the whole class against an empty environment; tests add what they need with patch.dict
+        cls.enterClassContext(patch.dict(os.environ, clear=True))
 
     def setUp(self):
-        # Mock the detected package managers to control which ones are "found"
-        self.patch_shutil_which = patch('shutil.which')
-        self.mock_shutil_which = self.patch_shutil_which.start()
-
-        self.patch_run_pm_command = patch('package_manager_integrator._run_pm_command')
-        self.mock_run_pm_command = self.patch_run_pm_command.start()
-
-    def tearDown(self):
-        self.patch_shutil_which.stop()
-        self.patch_run_pm_command.stop()
-
-    def test_detect_package_managers_windows(self):
-        if platform.system() == "Windows":
-            self.mock_shutil_which.side_effect = lambda exe: f"C:\\path\\to\\{exe}.exe" if exe in ["winget", "choco"] else None
-            detected = pmi.detect_package_managers()
-            self.assertIn("winget", detected)
-            self.assertIn("choco", detected)
-            self.assertNotIn("scoop", detected)
-            self.assertNotIn("brew", detected)
-            self.assertEqual(detected["winget"]["path"], "C:\\path\\to\\winget.exe")
-        else:
-            self.skipTest("Skipping Windows specific PM detection test on non-Windows OS.")
-
-    def test_detect_package_managers_macos(self):
-        if platform.system() == "Darwin":
-            self.mock_shutil_which.side_effect = lambda exe: f"/usr/local/bin/{exe}" if exe == "brew" else None
-            detected = pmi.detect_package_managers()
-            self.assertIn("brew", detected)
-            self.assertNotIn("apt", detected)
-        else:
-            self.skipTest("Skipping macOS specific PM detection test on non-macOS OS.")
-
-    def test_detect_package_managers_linux(self):
-        if platform.system() == "Linux":
-            self.mock_shutil_which.side_effect = lambda exe: f"/usr/bin/{exe}" if exe in ["apt-get", "snap"] else None
-            detected = pmi.detect_package_managers()
-            self.assertIn("apt", detected) # Note: 'apt' detection uses 'apt-get'
-            self.assertIn("snap", detected)
-            self.assertNotIn("brew", detected) # Unless Linuxbrew is specifically mocked
-        else:
-            self.skipTest("Skipping Linux specific PM detection test on non-Linux OS.")
-
-    def test_get_pm_package_name(self):
-        self.assertEqual(pmi.get_pm_package_name("python", "apt"), "python3")
-        self.assertEqual(pmi.get_pm_package_name("vscode", "snap"), "code")
-        self.assertIsNone(pmi.get_pm_package_name("unknown_tool", "apt"))
-        self.assertIsNone(pmi.get_pm_package_name("python", "unknown_pm"))
-
-    def test_parse_version_from_output_apt(self):
-        output_candidate = "Package: python3\nVersion: 3.9.2-1ubuntu1\nCandidate: 3.9.7-1~20.04\n"
-        self.assertEqual(pmi.parse_version_from_output(output_candidate, "apt", "python3"), "3.9.7-1~20.04")
-        # Test with apt show output format (often just Version:)
-        output_show = """Package: python3
-Status: install ok installed
-Priority: important
-Section: python
-Installed-Size: 424
-Maintainer: Ubuntu Core Developers <ubuntu-devel-discuss@lists.ubuntu.com>
-Architecture: amd64
-Source: python3-defaults (3.8.2-0ubuntu2)
-Version: 3.8.2-0ubuntu2
-Provides: python3-dev (= 3.8.2-0ubuntu2)
-Depends: python3.8 (>= 3.8.2-1~)
-Suggests: python3-setuptools, python3-pip
-Conflicts: python3-dev (<< 3.8.2-0ubuntu2)
-Breaks: python-virtualenv (<< 1.7.1.2-2~)
-Replaces: python3-dev (<< 3.8.2-0ubuntu2)
-Description: interactive high-level object-oriented language (default python3 version)
- Python, the high-level, interactive object oriented language, includes an
- extensive class library with lots of goodies for network programming, GUI
- development, regular expressions, etc.
- .
- This package is a dependency package, which depends on Debian's default
- Python 3 version (currently v3.8).
-Original-Maintainer: Debian Python Modules Team <python-modules-team@lists.alioth.debian.org>
-""" # End of triple-quoted string
-        self.assertEqual(pmi.parse_version_from_output(output_show, "apt", "python3"), "3.8.2-0ubuntu2")
-
-    def test_parse_version_from_output_brew(self):
-        output = "git: stable 2.30.1 (bottled), HEAD\n"
-        self.assertEqual(pmi.parse_version_from_output(output, "brew", "git"), "2.30.1")
-        output_simple = "python@3.9: 3.9.12\n"
-        self.assertEqual(pmi.parse_version_from_output(output_simple, "brew", "python@3.9"), "3.9.12")
-
-    def test_parse_version_from_output_winget(self):
-        output = """
-Name        Id                 Version   Matched By
-----------------------------------------------------
-Python 3.11  Python.Python.3.11  3.11.4   Moniker
-Python 3.10  Python.Python.3.10  3.10.11  Moniker
-Git          Git.Git             2.40.0   Moniker
-"""
-        self.assertEqual(pmi.parse_version_from_output(output, "winget", "Python.Python.3.10"), "3.10.11")
-        self.assertEqual(pmi.parse_version_from_output(output, "winget", "Git.Git"), "2.40.0")
-        self.assertIsNone(pmi.parse_version_from_output(output, "winget", "NonExistent.Package"))
-
-    @patch('package_manager_integrator.detect_package_managers')
-    def test_get_latest_version_and_update_command_success(self, mock_detect_pms):
-        mock_detect_pms.return_value = {"brew": {"name": "Homebrew", "path": "/usr/local/bin/brew"}}
-        self.mock_run_pm_command.return_value = ("git: stable 2.40.0 (bottled), HEAD\n", "")
-
-        tool_id = "git"
-        tool_name = "Git"
-        installed_version = "2.39.0"
-        preferred_pms = ["brew"]
-
-        result = pmi.get_latest_version_and_update_command(tool_id, tool_name, installed_version, preferred_pms)
-
-        self.assertIsNotNone(result)
-        self.assertEqual(result["latest_version"], "2.40.0")
-        self.assertEqual(result["package_manager_id"], "brew")
-        self.assertEqual(result["package_manager_name"], "Homebrew")
-        self.assertEqual(result["package_name_in_pm"], "git")
-        self.assertTrue("brew upgrade git" in result["update_command"])
-        self.assertTrue(result["is_update_available"])
-
-        installed_version_latest = "2.40.0"
-        result_latest = pmi.get_latest_version_and_update_command(tool_id, tool_name, installed_version_latest, preferred_pms)
-        self.assertFalse(result_latest["is_update_available"])
-
-    @patch('package_manager_integrator.detect_package_managers')
-    def test_get_latest_version_no_mapping(self, mock_detect_pms):
-        mock_detect_pms.return_value = {"apt": {"name": "APT", "path":"/usr/bin/apt-get"}}
-        result = pmi.get_latest_version_and_update_command("unknown_tool_id", "UnknownTool", "1.0", ["apt"])
-        self.assertIsNone(result)
-
-    @patch('package_manager_integrator.detect_package_managers')
-    def test_get_latest_version_pm_command_fails(self, mock_detect_pms):
-        mock_detect_pms.return_value = {"brew": {"name": "Homebrew", "path":"/usr/local/bin/brew"}}
-        self.mock_run_pm_command.return_value = (None, "Error occurred")
-        result = pmi.get_latest_version_and_update_command("git", "Git", "1.0", ["brew"])
-        self.assertIsNone(result)
-
-    @patch('package_manager_integrator.detect_package_managers')
-    def test_get_latest_version_version_parse_fails(self, mock_detect_pms):
-        mock_detect_pms.return_value = {"brew": {"name": "Homebrew", "path":"/usr/local/bin/brew"}}
-        self.mock_run_pm_command.return_value = ("Some unexpected output", "")
-        result = pmi.get_latest_version_and_update_command("git", "Git", "1.0", ["brew"])
-        self.assertIsNone(result)
-
-    @patch('package_manager_integrator.detect_package_managers')
-    def test_version_comparison_logic(self, mock_detect_pms):
-        mock_detect_pms.return_value = {"brew": {"name": "Homebrew", "path": "/usr/local/bin/brew"}}
-
-        # Mock a tool that exists in TOOL_TO_PM_PACKAGE_MAP for brew
-        original_tool_map = pmi.TOOL_TO_PM_PACKAGE_MAP.get("mytool_id_version_test")
-        pmi.TOOL_TO_PM_PACKAGE_MAP["mytool_id_version_test"] = {"brew": "mytool-package"}
-        self.mock_run_pm_command.return_value = ("mytool-package: stable 1.0.10\n", "")
-
-        # Case 1: packaging library works (default behavior, no need to patch parse_version itself here unless testing its absence)
-        result = pmi.get_latest_version_and_update_command("mytool_id_version_test", "MyToolVersionTest", "1.0.2", ["brew"])
-        self.assertIsNotNone(result)
-        self.assertTrue(result["is_update_available"]) # 1.0.10 > 1.0.2
-
-        result_no_update = pmi.get_latest_version_and_update_command("mytool_id_version_test", "MyToolVersionTest", "1.0.10", ["brew"])
-        self.assertIsNotNone(result_no_update)
-        self.assertFalse(result_no_update["is_update_available"])
-
-        # Case 2: packaging library import fails (fallback to string comparison)
-        # For this, we need to simulate the ImportError for 'packaging.version' inside the function
-        with patch.dict('sys.modules', {'packaging.version': None, 'packaging': None}): # Simulate packaging module not being available
-            pmi.TOOL_TO_PM_PACKAGE_MAP['mytool_lexical'] = {'brew': 'mytool-lex'}
-            self.mock_run_pm_command.return_value = ("mytool-lex: stable 1.2\n", "")
-            result_lex = pmi.get_latest_version_and_update_command("mytool_lexical", "MyToolLex", "1.11", ["brew"]) # "1.2" > "1.11" lexicographically
-            self.assertIsNotNone(result_lex)
-            self.assertTrue(result_lex["is_update_available"])
-
-            self.mock_run_pm_command.return_value = ("mytool-lex: stable 2.0\n", "")
-            result_lex_major = pmi.get_latest_version_and_update_command("mytool_lexical", "MyToolLex", "1.9.9", ["brew"])
-            self.assertIsNotNone(result_lex_major)
-            self.assertTrue(result_lex_major["is_update_available"]) # "2.0" > "1.9.9"
-
-            del pmi.TOOL_TO_PM_PACKAGE_MAP['mytool_lexical']
-
-        # Restore original map if it existed, otherwise remove the test key
-        if original_tool_map is not None:
-            pmi.TOOL_TO_PM_PACKAGE_MAP["mytool_id_version_test"] = original_tool_map
-        else:
-            del pmi.TOOL_TO_PM_PACKAGE_MAP["mytool_id_version_test"]
+        self.mock_config = MappingProxyType(_CONFIG_TEMPLATE)
+
+        # Keep the scanner away from the user's real config file
+        self.mock_load_config = self.enterContext(patch('scan_logic.load_config', return_value=self.mock_config))
+        self.mock_get_scan_options = self.enterContext(
+            patch('scan_logic.get_scan_options', return_value=MappingProxyType(_CONFIG_TEMPLATE["scan_options"]))
+        )
+
+        self.scanner = scan_logic.EnvironmentScanner()
+
+        # The scanner is rebuilt for every test, so its categorizer can simply be replaced.
+        # spec_set limits the mock to the one method the scanner calls.
+        self.mock_categorizer = self.scanner.categorizer = Mock(spec_set=['categorize_component'])
+        self.mock_categorizer.categorize_component.return_value = (None, None)
+
+    def test_collect_environment_variables(self):
+        test_env = {
+            "PATH": os.pathsep.join(["/fake/bin", "/missing/bin", "/duplicate/path", "/duplicate/path", ""]),
+            "JAVA_HOME": "/missing/java",
+            "TEST_HOME": "/fake/home",
+            "API_KEY": "not-for-reports",
+        }
+        with patch.dict(os.environ, test_env), \
+             patch('os.path.exists', side_effect=_VALID_PATHS.__contains__), \
+             patch('os.path.isdir', return_value=True):
+            self.scanner.collect_environment_variables()
+
+        by_name = {ev.name: ev for ev in self.scanner.environment_variables}
+        self.assertEqual([ev.name for ev in self.scanner.environment_variables], sorted(test_env))
+
+        path_var_info = by_name["PATH"]
+        path_issue_descs = {issue.description for issue in path_var_info.issues}
+        self.assertEqual(path_issue_descs, {
+            "PATH entry '/missing/bin' does not exist.",
+            "PATH entry '/duplicate/path' is duplicated.",
+            "PATH entry 5 is empty.",
+        })
+        self.assertEqual(len(path_var_info.issues), 3)
+
+        java_home_issues = by_name["JAVA_HOME"].issues
+        self.assertEqual(len(java_home_issues), 1)
+        self.assertEqual(java_home_issues[0].severity, "Critical")
+        self.assertEqual(by_name["TEST_HOME"].issues, [])
+        self.assertEqual(by_name["API_KEY"].value, "****SENSITIVE_VALUE****")
+
+        # Per-variable issues are also reported at scanner level
+        self.assertEqual(len(self.scanner.issues), 4)
+
+    @patch.object(scan_logic, 'TOOLS_DB', _TEST_TOOLS_DB)
+    def test_identify_tools_python_example(self):
+        fake_exe = "/fake/bin/python3"
+        with patch.object(self.scanner, '_find_executable_in_path', return_value=fake_exe) as mock_find, \
+             patch.object(self.scanner, '_get_version_from_command', return_value="3.10.4") as mock_get_version, \
+             patch('os.path.realpath', side_effect=lambda path: path):
+            self.scanner.identify_tools()
+
+        mock_find.assert_called_once_with("python3")
+        mock_get_version.assert_called_once_with(str(Path(fake_exe)), ["--version"], _PYTHON_VERSION_RE)
+        self.assertEqual(len(self.scanner.detected_components), 1)
+        component = self.scanner.detected_components[0]
+        self.assertEqual((component.name, component.version, component.category), ("Python", "3.10.4", "Language"))
+        self.assertEqual(component.executable_path, str(Path(fake_exe)))
+        self.assertEqual(component.path, str(Path(fake_exe).parent))
+        self.mock_categorizer.categorize_component.assert_called_once_with("Python", component.executable_path)
+
+    @patch('subprocess.Popen')
+    def test_run_command_success(self, mock_popen):
+        mock_popen.return_value = _make_popen_mock(stdout="hello\n")
+        self.assertEqual(self.scanner._run_command(["echo", "hello"]), ("hello\n", "", 0))
+        mock_popen.assert_called_once()
+        args, kwargs = mock_popen.call_args
+        self.assertEqual(args, (["echo", "hello"],))
+        self.assertTrue(kwargs["text"]) # stdout/stderr come back as str, not bytes
+        mock_popen.return_value.communicate.assert_called_once_with(timeout=5)
+
+    @patch('subprocess.Popen')
+    def test_run_command_timeout(self, mock_popen):
+        process = mock_popen.return_value = _make_popen_mock(
+            communicate_side_effect=[subprocess.TimeoutExpired(["sleep", "10"], 1), ("", "killed")]
+        )
+        self.assertEqual(self.scanner._run_command(["sleep", "10"], timeout=1), ("", "TimeoutExpired: killed", -1))
+        process.kill.assert_called_once_with()
+
+    @patch.dict(os.environ, {"PATH": os.pathsep.join(["/empty/dir", "/fake/bin"])})
+    @patch.multiple(Path, is_file=DEFAULT, resolve=DEFAULT)
+    @patch('os.access', return_value=True)
+    def test_find_executable_in_path(self, mock_access, is_file, resolve):
+        resolved = Path("/fake/bin/python")
+        is_file.side_effect = [False, True]
+        resolve.return_value = resolved
+
+        self.assertEqual(self.scanner._find_executable_in_path("python"), str(resolved))
+        # Second lookup is served from found_executables without touching the filesystem
+        self.assertEqual(self.scanner._find_executable_in_path("python"), str(resolved))
+
+        self.assertEqual(is_file.call_count, 2)
+        mock_access.assert_called_once_with(Path("/fake/bin") / "python", os.X_OK)
+
+    def test_run_scan_returns_report_order(self):
+        def fake_identify_tools():
+            self.scanner.detected_components.extend([
+                scan_logic.DetectedComponent("node", "Node.js", category="Runtime", version="20.1"),
+                scan_logic.DetectedComponent("python", "Python", category="Language", version="3.12"),
+                scan_logic.DetectedComponent("java", "Java", category="Language", version="21"),
+            ])
+
+        def fake_analyze():
+            self.scanner.issues.extend([
+                scan_logic.ScanIssue("Outdated", "Warning", category="Updates"),
+                scan_logic.ScanIssue("Missing path", "Critical", category="PATH"),
+                scan_logic.ScanIssue("Duplicate", "Critical", category="PATH"),
+            ])
+
+        with patch.multiple(self.scanner, identify_tools=DEFAULT, scan_file_system=DEFAULT,
+                            collect_environment_variables=DEFAULT, cross_reference_and_analyze=DEFAULT) as stages:
+            stages["identify_tools"].side_effect = fake_identify_tools
+            stages["cross_reference_and_analyze"].side_effect = fake_analyze
+            components, _, issues = self.scanner.run_scan()
+
+        self.assertEqual([c.id for c in components], ["java", "python", "node"])
+        self.assertEqual(components, sorted(components, key=scan_logic.component_sort_key))
+        self.assertEqual([i.description for i in issues], ["Duplicate", "Missing path", "Outdated"])
+        self.assertEqual(issues, sorted(issues, key=scan_logic.issue_sort_key))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file